@@ -205,11 +205,12 @@ class PrefixedSearchMixin:
                 ]
                 index = _prefixed_index_list
             elif isinstance(index, six.string_types):
-                _splitted_index = index.strip().split(',')
-                if len(_splitted_index) > 1:
+                # Only split when needed; single index names are the
+                # common case.
+                if ',' in index:
                     _prefix_index_list = [
                         build_alias_name(_index)
-                        for _index in _splitted_index]
+                        for _index in index.strip().split(',')]
                     index = ','.join(_prefix_index_list)
                 else:
                     index = build_alias_name(index)
@@ -127,14 +127,16 @@ def list_cmd(only_active, only_aliases, verbose):
         # Note that on every recursion rec_list is copied,
         # which might not be very effective for very deep dictionaries.
         rec_list = rec_list or []
+        last_idx = len(d) - 1
         for idx, key in enumerate(sorted(d)):
+            is_last = idx == last_idx
             line = (['│' + ' ' * indent
                      if i == 1 else ' ' * (indent+1) for i in rec_list])
-            line.append('└──' if len(d)-1 == idx else '├──')
+            line.append('└──' if is_last else '├──')
             click.echo(''.join(line), nl=False)
             if isinstance(d[key], dict):
                 click.echo(key)
-                new_rec_list = rec_list + [0 if len(d)-1 == idx else 1]
+                new_rec_list = rec_list + [0 if is_last else 1]
                 _tree_print(d[key], new_rec_list, verbose)
             else:
                 leaf_txt = '{} -> {}'.format(key, d[key]) if verbose else key
@@ -421,7 +421,7 @@ class _SearchState(object):
                         indices_to_delete = []
                     else:
                         indices_to_delete = list(lookup_response.keys())
-                    if len(indices_to_delete) == 0:
+                    if not indices_to_delete:
                         pass
                     elif len(indices_to_delete) == 1:
                         yield name, self.client.indices.delete(